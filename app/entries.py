@@ -1,7 +1,13 @@
 from fastapi import APIRouter, Query, HTTPException, Depends
 from pydantic import BaseModel
 from typing import Literal, List, Optional
-from datetime import datetime, date
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+import sys
+import threading
 import uuid
 import logging
 
@@ -24,51 +30,117 @@ class TextEntryIn(BaseModel):
     createdAt: str | None = None
     analysis: Optional[Analysis] = None
 
+@dataclass(slots=True)
+class NoteRow:
+    """Compact slot-packed storage form of a note; no per-instance __dict__
+    or validation overhead. Pydantic Note is built only at the API boundary."""
+    id: str
+    createdAt: str
+    text: str
+    sentiment: str
+    intensity: int
+    emotions: tuple[str, ...]
+    themes: tuple[str, ...]
+
+def _to_note(row: NoteRow) -> Note:
+    """Build the response-model Note for a stored row"""
+    return Note(
+        id=row.id,
+        createdAt=row.createdAt,
+        text=row.text,
+        analysis=Analysis(
+            sentiment=row.sentiment,
+            intensity=row.intensity,
+            emotions=list(row.emotions),
+            themes=list(row.themes),
+        ),
+    )
+
 # In-memory storage (replace with database in production)
-NOTES: list[Note] = []
+NOTES: list[NoteRow] = []
 
-def parse_iso(s: str) -> date: 
+# FastAPI runs these sync endpoints in a threadpool; the lock keeps NOTES,
+# _DATES, and the running aggregates mutating as one atomic unit.
+_NOTES_LOCK = threading.Lock()
+
+# Column of createdAt strings parallel to NOTES. Binary searches probe this
+# flat string list directly, with no per-probe attribute access or key calls.
+_DATES: list[str] = []
+
+# Running /stats aggregates, updated on every insert so the endpoint is O(1)
+_SENTIMENT_COUNTS = {"positive": 0, "neutral": 0, "negative": 0}
+_EMOTION_COUNTER: Counter = Counter()
+_THEME_COUNTER: Counter = Counter()
+# Date range as raw ISO strings: lexicographic min/max equals chronological
+_MIN_ISO: str | None = None
+_MAX_ISO: str | None = None
+
+def _register_note(note: NoteRow) -> None:
+    """Fold a newly stored note into the running aggregates"""
+    global _MIN_ISO, _MAX_ISO
+    _SENTIMENT_COUNTS[note.sentiment] += 1
+    _EMOTION_COUNTER.update(note.emotions)
+    _THEME_COUNTER.update(note.themes)
+    if _MIN_ISO is None or note.createdAt < _MIN_ISO:
+        _MIN_ISO = note.createdAt
+    if _MAX_ISO is None or note.createdAt > _MAX_ISO:
+        _MAX_ISO = note.createdAt
+
+@lru_cache(maxsize=8192)
+def _parse_iso_cached(s: str) -> date | None:
+    """Parse YYYY-MM-DD, memoized; None (cached too) marks invalid input"""
+    # fromisoformat accepts looser formats from 3.11 on; pin strict YYYY-MM-DD
+    if len(s) != 10 or s[4] != "-" or s[7] != "-":
+        return None
     try:
-        return datetime.strptime(s, "%Y-%m-%d").date()
+        return date.fromisoformat(s)
     except ValueError:
+        return None
+
+def parse_iso(s: str) -> date: 
+    parsed = _parse_iso_cached(s)
+    if parsed is None:
         raise HTTPException(400, f"Invalid date format: {s}. Expected YYYY-MM-DD")
+    return parsed
 
 def iso(d: date) -> str: 
     return d.strftime("%Y-%m-%d")
 
-def filter_notes_by_scope(notes: List[Note], scope: str, target_date: date) -> List[Note]:
-    """Filter notes based on scope and date"""
+def filter_notes_by_scope(notes: List[NoteRow], scope: str, target_date: date) -> List[NoteRow]:
+    """Filter notes based on scope and date.
+
+    Notes are kept sorted ascending by createdAt, so every scope reduces to an
+    inclusive ISO-string range that can be binary-searched at both ends.
+    """
     from datetime import timedelta
     
     if scope == "summary" or scope == "year":
-        # Return all notes from the same year
-        return [n for n in notes if parse_iso(n.createdAt).year == target_date.year]
-    
+        # All notes from the same year
+        lo = target_date.strftime("%Y-01-01")
+        hi = target_date.strftime("%Y-12-31")
+
     elif scope == "month":
-        # Return notes from the same month
-        return [n for n in notes if (
-            parse_iso(n.createdAt).year == target_date.year and 
-            parse_iso(n.createdAt).month == target_date.month
-        )]
-    
+        # "-31" is a valid lexicographic upper bound even for shorter months
+        lo = target_date.strftime("%Y-%m-01")
+        hi = target_date.strftime("%Y-%m-31")
+
     elif scope == "week":
-        # Return notes from the same week (Monday to Sunday)
-        from datetime import timedelta
-        
-        # Find the start of the week (Monday)
-        days_since_monday = target_date.weekday()
-        week_start = target_date - timedelta(days=days_since_monday)
-        week_end = week_start + timedelta(days=6)
-        
-        return [n for n in notes if week_start <= parse_iso(n.createdAt) <= week_end]
-    
+        # Same week, Monday to Sunday
+        week_start = target_date - timedelta(days=target_date.weekday())
+        lo = iso(week_start)
+        hi = iso(week_start + timedelta(days=6))
+
     elif scope == "day":
-        # Return notes from the same day
-        return [n for n in notes if parse_iso(n.createdAt) == target_date]
-    
+        lo = hi = iso(target_date)
+
     else:
         return notes
 
+    dates = _DATES if notes is NOTES else [n.createdAt for n in notes]
+    lo_i = bisect_left(dates, lo)
+    hi_i = bisect_right(dates, hi)
+    return notes[lo_i:hi_i]
+
 @router.get("", response_model=List[Note])
 def get_entries(
     scope: Literal["summary","year","month","week","day"] = Query(...), 
@@ -82,9 +154,9 @@ def get_entries(
     
     # Filter notes by scope
     filtered_notes = filter_notes_by_scope(NOTES, scope, target_date)
-    
-    # Sort by date (newest first)
-    return sorted(filtered_notes, key=lambda n: n.createdAt, reverse=True)
+
+    # The store is kept sorted ascending, so newest-first is just a reversal
+    return [_to_note(row) for row in reversed(filtered_notes)]
 
 @router.post("/text", response_model=Note, status_code=201)
 def add_text_entry(payload: TextEntryIn):
@@ -107,18 +179,31 @@ def add_text_entry(payload: TextEntryIn):
     )
     
     # Create the note
-    note = Note(
-        id=str(uuid.uuid4())[:8],
+    note = NoteRow(
+        id=uuid.uuid4().hex[:8],
         createdAt=iso(created),
         text=payload.text.strip(),
-        analysis=analysis,
+        sentiment=sys.intern(analysis.sentiment),
+        intensity=analysis.intensity,
+        emotions=tuple(sys.intern(e) for e in analysis.emotions),
+        themes=tuple(sys.intern(t) for t in analysis.themes),
     )
     
-    # Add to storage (insert at beginning for newest-first ordering)
-    NOTES.insert(0, note)
+    # Keep storage sorted ascending by createdAt for binary-searched queries.
+    # Entries normally arrive in date order, so the common case is an O(1)
+    # append; only backdated entries pay the O(N) insert shift.
+    with _NOTES_LOCK:
+        if not _DATES or note.createdAt >= _DATES[-1]:
+            NOTES.append(note)
+            _DATES.append(note.createdAt)
+        else:
+            i = bisect_right(_DATES, note.createdAt)
+            NOTES.insert(i, note)
+            _DATES.insert(i, note.createdAt)
+        _register_note(note)
     
     logging.info(f"Created new entry {note.id} with sentiment: {analysis.sentiment}")
-    return note
+    return _to_note(note)
 
 @router.get("/stats")
 def get_stats():
@@ -132,33 +217,17 @@ def get_stats():
             "date_range": None
         }
     
-    # Calculate sentiment breakdown
-    sentiment_counts = {"positive": 0, "neutral": 0, "negative": 0}
-    all_emotions = []
-    all_themes = []
-    
-    for note in NOTES:
-        sentiment_counts[note.analysis.sentiment] += 1
-        all_emotions.extend(note.analysis.emotions)
-        all_themes.extend(note.analysis.themes)
-    
-    # Count emotion and theme frequencies
-    from collections import Counter
-    emotion_counter = Counter(all_emotions)
-    theme_counter = Counter(all_themes)
-    
-    # Get date range
-    dates = [parse_iso(n.createdAt) for n in NOTES]
+    # The aggregates are maintained incrementally at insert time
     date_range = {
-        "earliest": iso(min(dates)),
-        "latest": iso(max(dates))
-    } if dates else None
+        "earliest": _MIN_ISO,
+        "latest": _MAX_ISO
+    } if _MIN_ISO is not None else None
     
     return {
         "total_entries": len(NOTES),
-        "sentiment_breakdown": sentiment_counts,
-        "top_emotions": emotion_counter.most_common(10),
-        "top_themes": theme_counter.most_common(10),
+        "sentiment_breakdown": dict(_SENTIMENT_COUNTS),
+        "top_emotions": _EMOTION_COUNTER.most_common(10),
+        "top_themes": _THEME_COUNTER.most_common(10),
         "date_range": date_range
     }
 
@@ -245,14 +314,23 @@ def create_august_sample_data():
         }
     ]
     
-    for entry_data in sample_entries:
-        note = Note(
-            id=str(uuid.uuid4())[:8],
+    notes = [
+        NoteRow(
+            id=uuid.uuid4().hex[:8],
             createdAt=entry_data["createdAt"],
             text=entry_data["text"],
-            analysis=entry_data["analysis"]
+            sentiment=sys.intern(entry_data["analysis"].sentiment),
+            intensity=entry_data["analysis"].intensity,
+            emotions=tuple(sys.intern(e) for e in entry_data["analysis"].emotions),
+            themes=tuple(sys.intern(t) for t in entry_data["analysis"].themes),
         )
-        NOTES.append(note)
+        for entry_data in sample_entries
+    ]
+    with _NOTES_LOCK:
+        NOTES.extend(notes)
+        _DATES.extend(note.createdAt for note in notes)
+        for note in notes:
+            _register_note(note)
     
     logging.info(f"Created {len(sample_entries)} sample entries from August 15-30th")
 
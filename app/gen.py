@@ -16,6 +16,9 @@ env = Environment(
     autoescape=select_autoescape()
 )
 
+# Compile each template once at import so requests skip the loader lookup
+_COMPILED = {name: env.get_template(name) for name in TEMPLATES}
+
 class GenIn(BaseModel):
     sentiment_label: str
     user: Optional[Dict] = {}
@@ -27,8 +30,6 @@ class GenOut(BaseModel):
 @router.post("/template", response_model=GenOut)
 def gen_template(inp: GenIn):
     label = (inp.sentiment_label or "NEUTRAL").upper()
-    if label not in TEMPLATES:
-        label = "NEUTRAL"
-    tmpl = env.get_template(label)
+    tmpl = _COMPILED.get(label, _COMPILED["NEUTRAL"])
     out = tmpl.render(user=inp.user or {}, context=inp.context or {})
     return {"text": out.strip()}